@@ -3,20 +3,57 @@ This is  a Python library for interacting with the UniversalSpeech DLL, providin
 This library works with python 32 and 64 bit.
 This module encapsulates the underlying functionality and exposes a simplified interface for working with the UniversalSpeech API.
 """
-import ctypes
-from typing import AnyStr
-from .load import Loader
+from enum import IntEnum
 from .exceptions import UnsupportedError
 
 #Identifiers for parameters
-VOLUME, VOLUME_MAX, VOLUME_MIN, VOLUME_SUPPORTED, \
-RATE, RATE_MAX, RATE_MIN, RATE_SUPPORTED, \
-PITCH, PITCH_MAX, PITCH_MIN, PITCH_SUPPORTED, \
-INFLECTION, INFLECTION_MAX, INFLECTION_MIN, INFLECTION_SUPPORTED, \
-PAUSED, PAUSE_SUPPORTED, \
-BUSY, BUSY_SUPPORTED, \
-WAIT, WAIT_SUPPORTED \
-	= range(0,22)
+class Param(IntEnum):
+    VOLUME = 0
+    VOLUME_MAX = 1
+    VOLUME_MIN = 2
+    VOLUME_SUPPORTED = 3
+    RATE = 4
+    RATE_MAX = 5
+    RATE_MIN = 6
+    RATE_SUPPORTED = 7
+    PITCH = 8
+    PITCH_MAX = 9
+    PITCH_MIN = 10
+    PITCH_SUPPORTED = 11
+    INFLECTION = 12
+    INFLECTION_MAX = 13
+    INFLECTION_MIN = 14
+    INFLECTION_SUPPORTED = 15
+    PAUSED = 16
+    PAUSE_SUPPORTED = 17
+    BUSY = 18
+    BUSY_SUPPORTED = 19
+    WAIT = 20
+    WAIT_SUPPORTED = 21
+
+# Module-level aliases kept for backward compatibility
+VOLUME = Param.VOLUME
+VOLUME_MAX = Param.VOLUME_MAX
+VOLUME_MIN = Param.VOLUME_MIN
+VOLUME_SUPPORTED = Param.VOLUME_SUPPORTED
+RATE = Param.RATE
+RATE_MAX = Param.RATE_MAX
+RATE_MIN = Param.RATE_MIN
+RATE_SUPPORTED = Param.RATE_SUPPORTED
+PITCH = Param.PITCH
+PITCH_MAX = Param.PITCH_MAX
+PITCH_MIN = Param.PITCH_MIN
+PITCH_SUPPORTED = Param.PITCH_SUPPORTED
+INFLECTION = Param.INFLECTION
+INFLECTION_MAX = Param.INFLECTION_MAX
+INFLECTION_MIN = Param.INFLECTION_MIN
+INFLECTION_SUPPORTED = Param.INFLECTION_SUPPORTED
+PAUSED = Param.PAUSED
+PAUSE_SUPPORTED = Param.PAUSE_SUPPORTED
+BUSY = Param.BUSY
+BUSY_SUPPORTED = Param.BUSY_SUPPORTED
+WAIT = Param.WAIT
+WAIT_SUPPORTED = Param.WAIT_SUPPORTED
 
 ENABLE_NATIVE_SPEECH = 0xFFFF
 VOICE = 0x10000
@@ -32,11 +69,33 @@ class UniversalSpeech:
     This class provides a convenient interface for interacting with the UniversalSpeech.dll library.
     It allows you to perform various speech-related operations such as saying messages, controlling speech parameters, and querying information about available speech engines.
     Attributes:
-        __uspeech (ctypes.CDLL): An instance of the UniversalSpeech DLL loaded using ctypes.
+        _lib (ctypes.CDLL): An instance of the UniversalSpeech DLL loaded using ctypes.
 """
 
+    __slots__ = ('_lib', '_say', '_say_a', '_braille', '_stop', '_get_value', '_set_value', '_get_string', '_string_cache', '__weakref__')
+
+    # kind -> (supported, value, min, max) parameter identifiers used by the set_* methods
+    _SETTER_TABLE = {
+        "rate": (Param.RATE_SUPPORTED, Param.RATE, Param.RATE_MIN, Param.RATE_MAX),
+        "volume": (Param.VOLUME_SUPPORTED, Param.VOLUME, Param.VOLUME_MIN, Param.VOLUME_MAX),
+        "pitch": (Param.PITCH_SUPPORTED, Param.PITCH, Param.PITCH_MIN, Param.PITCH_MAX),
+        "inflection": (Param.INFLECTION_SUPPORTED, Param.INFLECTION, Param.INFLECTION_MIN, Param.INFLECTION_MAX),
+    }
+
     def __init__(self) -> None:
-        self.__uspeech = Loader().load()
+        # Imported here so reading the constants doesn't pay for loading ctypes
+        from .load import Loader
+        self._lib = Loader().load()
+        # Bind the DLL functions to slots so each call skips the lookup on the CDLL object
+        self._say = self._lib.speechSay
+        self._say_a = self._lib.speechSayA
+        self._braille = self._lib.brailleDisplay
+        self._stop = self._lib.speechStop
+        self._get_value = self._lib.speechGetValue
+        self._set_value = self._lib.speechSetValue
+        self._get_string = self._lib.speechGetString
+        # Engine names, see get_string()
+        self._string_cache = {}
 
     def say(self, msg:str, interrupt:bool=True):
         """Say the given message using the speech engine.
@@ -44,43 +103,77 @@ class UniversalSpeech:
         - msg (str): The complete message to be spoken.
         - interrupt (bool): Whether to interrupt the current speech if True (optional, default is True).
         """
-        return self.__uspeech.speechSay(msg, interrupt)
+        return self._say(msg, interrupt)
+
+    def say_many(self, msgs:list, interrupt:bool=True) -> None:
+        """Say several messages one after another.
+        Parameters:
+        - msgs (list): The messages to be spoken, in order.
+        - interrupt (bool): Whether the first message interrupts the current speech (optional, default is True). The following messages are queued after it.
+        """
+        say = self._say
+        for msg in msgs:
+            say(msg, interrupt)
+            interrupt = False
 
     def say_a(self, msg:str, interrupt:bool=True):
         """Say the first letter of the given message using the speech engine."""
-        return self.__uspeech.speechSayA(msg, interrupt)
+        return self._say_a(msg, interrupt)
 
     def braille(self, msg:str):
         """Display the given message in braille."""
-        return self.__uspeech.brailleDisplay(msg)
+        return self._braille(msg)
 
     def speech(self, msg:str):
         """Perform both speech and braille display for the given message."""
-        self.say(msg)
-        self.braille(msg)
+        self._say(msg, True)
+        self._braille(msg)
 
     def speech_a(self, msg:str):
         """Perform  speech_a and braille display for the given message."""
-        self.sayA(msg)
-        self.braille(msg)
+        self._say_a(msg, True)
+        self._braille(msg)
 
     def stop(self):
         """Stop the speech."""
-        return self.__uspeech.speechStop()
+        return self._stop()
 
     def get_value(self, what):
         """Get the current value of a specific speech parameter."""
-        return self.__uspeech.speechGetValue(what)
+        return self._get_value(what)
 
     def set_value(self, what, value):
         """Set the value of a specific speech parameter."""
-        return self.__uspeech.speechSetValue(what, value)
+        return self._set_value(what, value)
+
+    def set_values(self, values) -> None:
+        """Set several speech parameters at once from an iterable of (what, value) pairs."""
+        set_value = self._set_value
+        for what, value in values:
+            set_value(what, value)
+
+    def apply_profile(self, profile:dict) -> None:
+        """
+        Apply a saved voice profile.
+
+        Parameters:
+        - profile (dict): A dictionary mapping parameter identifiers, such as Param.RATE or Param.VOLUME_MAX, to their values.
+        """
+        self.set_values(profile.items())
 
     def get_string(self, what) -> str:
-        """Get a string representation of a specific speech parameter."""
-        # Set the return type for the function
-        self.__uspeech.speechGetString.restype = ctypes.c_wchar_p
-        return self.__uspeech.speechGetString(what)
+        """Get a string representation of a specific speech parameter.
+
+        Engine names don't change at runtime, so they are cached; every other string is queried each time.
+        """
+        if not ENGINE <= what < ENGINE_AVAILABLE:
+            return self._get_string(what)
+
+        string = self._string_cache.get(what)
+        if string is None:
+            string = self._get_string(what)
+            self._string_cache[what] = string
+        return string
 
     def enable_native_speech(self, enabled:bool=True) -> None:
         """
@@ -116,41 +209,64 @@ that are generally reliable and can be used when no other engines are available.
         if engine not in engines:
             raise UnsupportedError(f"{engine} is not supported. Use self.get_engines() to know the supported engines.")
         
-        self.set_value(engine, engines[engine]["id"])
+        self.set_value(ENGINE, engines[engine]["id"])
 
     def get_engines(self) -> dict:
         """Get a Dictionary of available speech engines with their names, availability, and IDs."""
-        engines = {}
-        i = 0
-        while True:
-            name = self.get_string(ENGINE + i)
-            if not  name:
-                break
-            avail = self.get_value(ENGINE_AVAILABLE + i) != 0
-            engines[name] = {
+        return {
+            name: {
                 "name": name,
                 "available": avail,
                 "id": i
             }
+            for name, avail, i in self._enumerate_engines()
+        }
+
+    def _enumerate_engines(self) -> list:
+        """Walk the engine IDs and return a list of (name, available, id) tuples."""
+        get_string = self.get_string
+        get_value = self._get_value
+        engines = []
+        i = 0
+        name = get_string(ENGINE)
+        while name:
+            engines.append((name, bool(get_value(ENGINE_AVAILABLE + i)), i))
             i += 1
+            name = get_string(ENGINE + i)
 
         return engines
 
     @property
     def rate_supported(self) -> bool:
-        return self.get_value(RATE_SUPPORTED) != 0
+        return bool(self._get_value(Param.RATE_SUPPORTED))
 
     @property
     def volume_supported(self) -> bool:
-        return self.get_value(VOLUME_SUPPORTED) != 0
+        return bool(self._get_value(Param.VOLUME_SUPPORTED))
 
     @property
     def pitch_supported(self) -> bool:
-        return self.get_value(PITCH_SUPPORTED) != 0
+        return bool(self._get_value(Param.PITCH_SUPPORTED))
 
     @property
     def inflection_supported(self) -> bool:
-        return self.get_value(INFLECTION_SUPPORTED) != 0
+        return bool(self._get_value(Param.INFLECTION_SUPPORTED))
+
+    def _set(self, kind:str, value:int, min_value:int=None, max_value:int=None) -> None:
+        """Set a speech parameter and, optionally, its bounds, using the identifiers from _SETTER_TABLE."""
+        supported, what, what_min, what_max = self._SETTER_TABLE[kind]
+        if not self._get_value(supported):
+            raise UnsupportedError(f"Set {kind} is not supported with the current engine.")
+
+        values = [(what, value)]
+
+        if min_value is not None:
+            values.append((what_min, min_value))
+
+        if max_value is not None:
+            values.append((what_max, max_value))
+
+        self.set_values(values)
 
     def set_rate(self, value: int, min_rate: int = None, max_rate: int = None) -> None:
         """
@@ -164,17 +280,8 @@ that are generally reliable and can be used when no other engines are available.
              Raises:
         - UnsupportedError: If the function is not supported with the current engine.
     """
-        
-        if not self.rate_supported:
-            raise UnsupportedError("Set rate is not supported with the current engine.")
-        
-        self.set_value(RATE, value)
 
-        if min_rate is not None:
-            self.set_value(RATE_MIN, min_rate)
-
-        if max_rate is not None:
-            self.set_value(RATE_MAX, max_rate)
+        self._set("rate", value, min_rate, max_rate)
 
     def set_volume(self, value: int, min_volume: int = None, max_volume: int = None) -> None:
         """
@@ -188,17 +295,8 @@ that are generally reliable and can be used when no other engines are available.
              Raises:
         - UnsupportedError: If the function is not supported with the current engine.
     """
-        
-        if not self.volume_supported:
-            raise UnsupportedError("Set volume is not supported with the current engine.")
-        
-        self.set_value(VOLUME, value)
-
-        if min_volume is not None:
-            self.set_value(VOLUME_MIN, min_volume)
 
-        if max_volume is not None:
-            self.set_value(VOLUME_MAX, max_volume)
+        self._set("volume", value, min_volume, max_volume)
 
     def set_pitch(self, value: int, min_pitch: int = None, max_pitch: int = None) -> None:
         """
@@ -212,17 +310,8 @@ that are generally reliable and can be used when no other engines are available.
         Raises:
         - UnsupportedError: If the function is not supported with the current engine.
         """
-        
-        if not self.pitch_supported:
-            raise UnsupportedError("Set pitch is not supported with the current engine.")
-        
-        self.set_value(PITCH, value)
 
-        if min_pitch is not None:
-            self.set_value(PITCH_MIN, min_pitch)
-
-        if max_pitch is not None:
-            self.set_value(PITCH_MAX, max_pitch)
+        self._set("pitch", value, min_pitch, max_pitch)
 
     def set_inflection(self, value: int, min_inflection: int = None, max_inflection: int = None) -> None:
         """
@@ -236,14 +325,5 @@ that are generally reliable and can be used when no other engines are available.
         Raises:
         - UnsupportedError: If the function is not supported with the current engine.
         """
-        
-        if not self.inflection_supported:
-            raise UnsupportedError("Set inflection is not supported with the current engine.")
-        
-        self.set_value(INFLECTION, value)
-
-        if min_inflection is not None:
-            self.set_value(INFLECTION_MIN, min_inflection)
 
-        if max_inflection is not None:
-            self.set_value(INFLECTION_MAX, max_inflection)
+        self._set("inflection", value, min_inflection, max_inflection)
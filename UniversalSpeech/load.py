@@ -1,8 +1,24 @@
 import os
-import platform
+import sys
 import ctypes
 from .exceptions import DLLFileNotFoundError
 
+# Signatures of the functions exported by UniversalSpeech.dll: name -> (argtypes, restype)
+_PROTOTYPES = {
+    "speechSay": ([ctypes.c_wchar_p, ctypes.c_int], ctypes.c_int),
+    "speechSayA": ([ctypes.c_wchar_p, ctypes.c_int], ctypes.c_int),
+    "brailleDisplay": ([ctypes.c_wchar_p], ctypes.c_int),
+    "speechStop": ([], ctypes.c_int),
+    "speechGetValue": ([ctypes.c_int], ctypes.c_int),
+    "speechSetValue": ([ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    "speechGetString": ([ctypes.c_int], ctypes.c_wchar_p),
+}
+
+_CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The loaded library is shared by every Loader in the process
+_cached_dll = None
+
 class Loader:
     """
     Loader class for loading the UniversalSpeech.dll library.
@@ -10,9 +26,12 @@ class Loader:
     This class provides functionality to check for the existence of
     required DLL files and load the UniversalSpeech.dll library using ctypes.
 
+    The loaded library is cached at module level, so only the first call to load()
+    touches the disk.
+
     Attributes:
-        __current_dir (str): The current working directory.
-        __dll_files (list): A list of required DLL files.
+        __current_dir (str): The directory containing this package.
+        __dll_files (frozenset): The set of required DLL files.
         __lib_folder (str): The folder name based on the system architecture.
 
     Methods:
@@ -23,10 +42,11 @@ class Loader:
         DLLFileNotFoundError: Raised if any required DLL file is missing.
     """
 
+    __dll_files = frozenset(['dolapi.dll', 'jfwapi.dll', 'nvdaControllerClient.dll', 'SAAPI32.dll', 'UniversalSpeech.dll', 'UniversalSpeech.tlb'])
+
     def __init__(self) -> None:
-        self.__current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.__dll_files = ['dolapi.dll', 'jfwapi.dll', 'nvdaControllerClient.dll', 'SAAPI32.dll', 'UniversalSpeech.dll', 'UniversalSpeech.tlb']
-        self.__lib_folder = "lib64" if platform.architecture()[0] == "64bit" else "lib"
+        self.__current_dir = _CURRENT_DIR
+        self.__lib_folder = "lib64" if sys.maxsize > 2**32 else "lib"
 
     def _files_check(self) -> bool:
         """
@@ -37,15 +57,10 @@ class Loader:
         """
 
         lib_folder = os.path.join(self.__current_dir, self.__lib_folder)
-        if not os.path.exists(lib_folder):
+        if not os.path.isdir(lib_folder):
             return False
 
-        current_dll_files = os.listdir(lib_folder)
-        for file in self.__dll_files:
-            if file not in current_dll_files:
-                return False
-
-        return True
+        return all(os.path.isfile(os.path.join(lib_folder, file)) for file in self.__dll_files)
 
     def load(self) -> object:
         """
@@ -58,6 +73,10 @@ class Loader:
             DLLFileNotFoundError: Raised if any required DLL file is missing.
         """
 
+        global _cached_dll
+        if _cached_dll is not None:
+            return _cached_dll
+
         if not self._files_check():
             raise DLLFileNotFoundError("Missing dll files.")
 
@@ -65,5 +84,12 @@ class Loader:
         dll_path = os.path.join(self.__current_dir, self.__lib_folder, "UniversalSpeech.dll")
         uspeech = ctypes.CDLL(dll_path)
 
+        # Declare the signatures once so ctypes doesn't have to guess them on every call
+        for name, (argtypes, restype) in _PROTOTYPES.items():
+            function = getattr(uspeech, name)
+            function.argtypes = argtypes
+            function.restype = restype
+
+        _cached_dll = uspeech
         return uspeech
     
\ No newline at end of file